@@ -28,6 +28,13 @@ PY_VERSION = ".".join([str(x) for x in sys.version_info[:3]])
 
 CMODE_TEXT = 1
 CMODE_FILE = 2
+CMODE_HTML = 3
+CMODE_RTF = 4
+
+# MIME Targets
+
+MIME_HTML = "text/html"
+MIME_RTF = "text/rtf"
 
 # Display Servers (actually just used for the system that handles the clipboard)
 
@@ -35,4 +42,14 @@ DS_WINDOWS = 1           # Windows - Requires kernel, hense why it's not DS_EXPL
 DS_EXPLORER = DS_WINDOWS #         - alias for DS_WINDOWS
 DS_WINDOWSERVER = 2      # MacOS   - pbcopy, pbpaste
 DS_X11 = 3               # Linux   - xclip
-DS_WAYLAND = 4           #         - wl-copy, wl-paste\
\ No newline at end of file
+DS_WAYLAND = 4           #         - wl-copy, wl-paste\
+
+# Default Retry Policy (see `pasteli.core.configure`)
+
+DEFAULT_TIMEOUT = 5        # Seconds allowed per attempt.
+DEFAULT_DEADLINE = None    # Seconds allowed for the whole operation, including retries. None = no deadline.
+DEFAULT_RETRIES = 0        # Extra attempts after a timeout, or a non-zero exit accepted by DEFAULT_RETRY_ON.
+DEFAULT_BACKOFF = 0.1      # Seconds slept before the first retry, doubled on each following retry.
+DEFAULT_HEDGE = None       # Seconds before a second, hedged paste is started. None = no hedging.
+DEFAULT_RETRY_ON = None    # Callable deciding if a non-zero exit is transient. None = only retry timeouts.
+DEFAULT_CHUNK_SIZE = 65536 # Bytes read at a time when streaming a paste.
@@ -22,9 +22,12 @@ import subprocess
 import warnings
 import platform
 import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from urllib.parse import unquote_to_bytes
 from . import errors
-from typing import Optional, Union
+from typing import Callable, Iterator, Optional, Union
 
 if platform.system() == "windows" or os.name == "nt":
     # ALL OF THESE IMPORTS ARE ONLY FOR WINDOWS.
@@ -33,7 +36,215 @@ if platform.system() == "windows" or os.name == "nt":
     import win32con
     import struct
 
-def copy_text_wl(text,encode="utf-8"):
+_DEFAULT = object() # Marks a policy argument that wasn't passed, so an explicit None can mean "disabled".
+
+_policy = {
+    "timeout": const.DEFAULT_TIMEOUT,
+    "deadline": const.DEFAULT_DEADLINE,
+    "retries": const.DEFAULT_RETRIES,
+    "backoff": const.DEFAULT_BACKOFF,
+    "hedge": const.DEFAULT_HEDGE,
+    "retry_on": const.DEFAULT_RETRY_ON,
+}
+
+def configure(**policy) -> None:
+    """
+    Sets the global defaults used when a call doesn't pass its own.
+
+    Args:
+        timeout (float|None): Seconds allowed per attempt. None = wait forever.
+        deadline (float|None): Seconds allowed for the whole operation, including retries. None = no deadline.
+        retries (int): Extra attempts after a timeout, or after a non-zero exit accepted by `retry_on`.
+        backoff (float): Seconds slept before the first retry, doubled on each following retry.
+        hedge (float|None): Seconds before a second paste is started alongside a slow first one.
+        retry_on (Callable[[subprocess.CompletedProcess],bool]|None): Decides whether a non-zero exit is transient. None = only retry timeouts.
+
+    Raises:
+        TypeError: If an unknown option, or a value of the wrong type, is passed.
+        ValueError: If a negative number is passed.
+    """
+    for key,value in policy.items():
+        if key not in _policy:
+            raise TypeError(f"configure() got an unexpected keyword argument '{key}'")
+        match key:
+            case "retries":
+                if type(value) != int: raise TypeError(f"configure(retries=...)    expected an int, got {value!r}")
+            case "retry_on":
+                if value is not None and not callable(value): raise TypeError(f"configure(retry_on=...)    expected a callable or None, got {value!r}")
+            case "backoff":
+                if type(value) not in (int,float): raise TypeError(f"configure(backoff=...)    expected a number, got {value!r}")
+            case _:
+                if value is not None and type(value) not in (int,float): raise TypeError(f"configure({key}=...)    expected a number or None, got {value!r}")
+        if key != "retry_on" and value is not None and value < 0:
+            raise ValueError(f"configure({key}=...)    must not be negative, got {value!r}")
+    _policy.update(policy)
+
+def _collect(proc):
+    out,err = proc.communicate()
+    return subprocess.CompletedProcess(proc.args,proc.returncode,out,err)
+
+def _attempt(args,input,capture,timeout,hedge) -> subprocess.CompletedProcess:
+    """
+    Runs a commandline utility once. If `hedge` is set and the first read is still running
+    after `hedge` seconds, a second identical read is started. The first successful read wins;
+    a read that fails doesn't stop the other one, and is only returned if neither succeeds.
+
+    Raises:
+        subprocess.TimeoutExpired: If no process finished within `timeout`.
+    """
+    if hedge is None or not capture or input is not None or (timeout is not None and hedge >= timeout):
+        return subprocess.run(args,input=input,capture_output=capture,timeout=timeout,close_fds=True)
+    start = time.monotonic()
+    procs = []
+    pool = ThreadPoolExecutor(max_workers=2)
+    def launch():
+        proc = subprocess.Popen(args,stdout=subprocess.PIPE,stderr=subprocess.PIPE,close_fds=True)
+        procs.append(proc)
+        return pool.submit(_collect,proc)
+    try:
+        futures = [launch()]
+        done,_ = wait(futures,timeout=hedge)
+        if done:
+            return futures[0].result()
+        futures.append(launch())
+        pending = set(futures)
+        failure = None
+        while pending:
+            remaining = None if timeout is None else max(0,timeout-(time.monotonic()-start))
+            done,pending = wait(pending,timeout=remaining,return_when=FIRST_COMPLETED)
+            if not done: break
+            for future in done:
+                result = future.result()
+                if result.returncode == 0: return result
+                failure = result
+        if failure is None:
+            raise subprocess.TimeoutExpired(args,timeout)
+        return failure
+    finally:
+        for proc in procs:
+            if proc.poll() is None: proc.kill()
+        pool.shutdown(wait=True)
+
+def _run(args,input=None,capture=False,timeout=_DEFAULT,deadline=_DEFAULT,retries=_DEFAULT,backoff=_DEFAULT,hedge=_DEFAULT,retry_on=_DEFAULT) -> subprocess.CompletedProcess:
+    """
+    Runs a commandline utility under the retry policy. Arguments that aren't passed use the global defaults
+    (see `configure`); passing None disables that part of the policy for this call.
+    Timeouts are always retried. Non-zero exits are only retried when `retry_on` accepts them, since the
+    utilities also exit non-zero for permanent failures such as an empty clipboard or a target that isn't offered.
+
+    Args:
+        args (list[str]): The command to run.
+        input (bytes, optional): Data to write to the command's stdin.
+        capture (bool): Whether to capture stdout and stderr. Copy utilities fork and must not be captured.
+        timeout (float, optional): Seconds allowed per attempt.
+        deadline (float, optional): Seconds allowed for the whole operation, including retries.
+        retries (int, optional): Extra attempts after a timeout, or after a non-zero exit accepted by `retry_on`.
+        backoff (float, optional): Seconds slept before the first retry, doubled on each following retry.
+        hedge (float, optional): Seconds before a second, hedged read is started. Only used when capturing.
+        retry_on (Callable[[subprocess.CompletedProcess],bool], optional): Decides whether a non-zero exit is transient.
+
+    Raises:
+        pasteli.errors.ClipboardTimeoutError: If the last attempt timed out.
+        pasteli.errors.DeadlineExceededError: If the deadline ran out.
+        pasteli.errors.ClipboardExitError: If the last attempt exited with a non-zero status.
+
+    Returns:
+        subprocess.CompletedProcess: The successful run.
+    """
+    if timeout is _DEFAULT: timeout = _policy["timeout"]
+    if deadline is _DEFAULT: deadline = _policy["deadline"]
+    if retries is _DEFAULT: retries = _policy["retries"]
+    if backoff is _DEFAULT: backoff = _policy["backoff"]
+    if hedge is _DEFAULT: hedge = _policy["hedge"]
+    if retry_on is _DEFAULT: retry_on = _policy["retry_on"]
+    retries = retries or 0
+    backoff = backoff or 0
+    utility = args[0]
+    end = None if deadline is None else time.monotonic()+deadline
+    attempt = 0
+    while True:
+        attempt += 1
+        limit = timeout
+        if end is not None:
+            remaining = end-time.monotonic()
+            if remaining <= 0:
+                raise errors.DeadlineExceededError(f"{utility} did not finish within the {deadline}s deadline.",utility=utility,attempts=attempt-1)
+            limit = remaining if timeout is None else min(timeout,remaining)
+        try:
+            result = _attempt(args,input,capture,limit,hedge)
+        except subprocess.TimeoutExpired:
+            if end is not None and time.monotonic() >= end:
+                raise errors.DeadlineExceededError(f"{utility} did not finish within the {deadline}s deadline.",utility=utility,attempts=attempt) from None
+            error = errors.ClipboardTimeoutError(f"{utility} timed out after {attempt} attempt(s), and the clipboard could not be accessed.",utility=utility,attempts=attempt)
+        else:
+            if result.returncode == 0:
+                return result
+            error = errors.ClipboardExitError(f"{utility} returned exit status {result.returncode} after {attempt} attempt(s).",utility=utility,returncode=result.returncode,stderr=result.stderr,attempts=attempt)
+            if retry_on is None or not retry_on(result):
+                raise error
+        if attempt > retries:
+            raise error
+        delay = backoff*(2**(attempt-1))
+        if end is not None and time.monotonic()+delay >= end:
+            raise errors.DeadlineExceededError(f"{utility} did not finish within the {deadline}s deadline.",utility=utility,attempts=attempt) from error
+        time.sleep(delay)
+
+def _stream(args,timeout=_DEFAULT,deadline=_DEFAULT,retries=_DEFAULT,backoff=_DEFAULT,hedge=_DEFAULT,retry_on=_DEFAULT,chunk_size=const.DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Runs a commandline utility and yields its stdout in chunks as they arrive.
+    The whole read has to finish within the tighter of `timeout` and `deadline`. Retries and hedging
+    aren't applied, since chunks have already been handed to the caller by the time a failure is seen;
+    a `pasteli.errors.ClipboardUtilityWarning` is raised if they were passed to this call.
+
+    Raises:
+        pasteli.errors.ClipboardTimeoutError: If the read took longer than `timeout`.
+        pasteli.errors.DeadlineExceededError: If the read took longer than `deadline`.
+        pasteli.errors.ClipboardExitError: If the utility exited with a non-zero status.
+
+    Returns:
+        Iterator[bytes]: The utility's stdout, in chunks of at most `chunk_size` bytes.
+    """
+    if timeout is _DEFAULT: timeout = _policy["timeout"]
+    if deadline is _DEFAULT: deadline = _policy["deadline"]
+    # Only warn about retries and hedging asked for on this call; the global policy is ignored silently.
+    if (retries is not _DEFAULT and retries) or (hedge is not _DEFAULT and hedge is not None):
+        warnings.warn("Streamed pastes aren't retried or hedged, so `retries`, `retry_on` and `hedge` are ignored.",errors.ClipboardUtilityWarning)
+    utility = args[0]
+    limits = [x for x in (timeout,deadline) if x is not None]
+    limit = min(limits) if limits else None
+    expired = threading.Event()
+    proc = subprocess.Popen(args,stdout=subprocess.PIPE,stderr=subprocess.PIPE,close_fds=True)
+    def expire():
+        expired.set()
+        proc.kill()
+    timer = None if limit is None else threading.Timer(limit,expire)
+    # stderr is drained alongside stdout, or a chatty utility fills the pipe and never closes stdout.
+    stderr = []
+    drain = threading.Thread(target=lambda: stderr.append(proc.stderr.read()),daemon=True)
+    try:
+        drain.start()
+        if timer: timer.start()
+        while chunk := proc.stdout.read1(chunk_size):
+            yield chunk
+        proc.wait()
+        if timer: timer.cancel()
+    finally:
+        if timer: timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        drain.join()
+        proc.stdout.close()
+        proc.stderr.close()
+    # The timer can fire just after a successful exit; only a process it actually killed counts as expired.
+    if expired.is_set() and proc.returncode < 0:
+        if deadline is not None and limit == deadline:
+            raise errors.DeadlineExceededError(f"{utility} did not finish within the {deadline}s deadline.",utility=utility)
+        raise errors.ClipboardTimeoutError(f"{utility} timed out, and the clipboard could not be accessed.",utility=utility)
+    if proc.returncode != 0:
+        raise errors.ClipboardExitError(f"{utility} returned exit status {proc.returncode}.",utility=utility,returncode=proc.returncode,stderr=b"".join(stderr))
+
+def copy_text_wl(text,encode="utf-8",**policy):
     """
     Copies text to the clipboard, on Linux (Wayland).
 
@@ -43,9 +254,9 @@ def copy_text_wl(text,encode="utf-8"):
     """
     if encode != "bytes": text = text.encode(encode)
     # warnings.warn("pasteli.core.copy_text_wl(text,encode='utf-8') is not complete. Functionality may be missing.",errors.UnfinishedWarning)
-    subprocess.run(["wl-copy"],input=text,check=True,close_fds=True)
+    _run(["wl-copy"],input=text,**policy)
 
-def copy_text_x11(text,encode="utf-8"):
+def copy_text_x11(text,encode="utf-8",**policy):
     """
     Copies text to the clipboard, on Linux (X11).
 
@@ -55,10 +266,10 @@ def copy_text_x11(text,encode="utf-8"):
     """
     if encode != "bytes": text = text.encode(encode)
     # warnings.warn("pasteli.core.copy_text_x11(text,encode='utf-8') is not complete. Functionality may be missing.",errors.UnfinishedWarning)
-    subprocess.run(["xclip","-selection","clipboard"],input=text,check=True,close_fds=True)
+    _run(["xclip","-selection","clipboard"],input=text,**policy)
     # raise NotImplementedError("pasteli.core.copy_text(text)")
 
-def copy_text_windows(text,encode="utf-8"):
+def copy_text_windows(text,encode="utf-8",**policy):
     """
     Copies text to the clipboard, on MacOS.
 
@@ -79,7 +290,7 @@ def copy_text_windows(text,encode="utf-8"):
     wc.SetClipboardData(win32con.CF_UNICODETEXT,text)
     wc.CloseClipboard()
 
-def copy_text_mac(text,encode="utf-8"):
+def copy_text_mac(text,encode="utf-8",**policy):
     """
     Copies text to the pasteboard, on MacOS.
 
@@ -88,10 +299,10 @@ def copy_text_mac(text,encode="utf-8"):
         encode (str): The encoding that's being passed.
     """
     if encode != "bytes": text = text.encode(encode)
-    subprocess.run(["pbcopy"],input=text,check=True,close_fds=True)
+    _run(["pbcopy"],input=text,**policy)
     # raise NotImplementedError("pasteli.core.copy_text_mac(text,encode='utf-8')")
 
-def copy_file_wl(files:list[Union[str,bytes]],encode="utf-8"):
+def copy_file_wl(files:list[Union[str,bytes]],encode="utf-8",**policy):
     """
     Copies a file to the clipboard, on Linux (Wayland).
 
@@ -102,9 +313,9 @@ def copy_file_wl(files:list[Union[str,bytes]],encode="utf-8"):
     uris = [f"file://{os.path.abspath(file)}" for file in files if len(file) != 0]
     if encode != "bytes": uris = [uri.encode(encode) for uri in uris]
     uris = b"\n".join(uris)
-    subprocess.run(["wl-copy","-t","text/uri-list"],input=uris,check=True,close_fds=True)
+    _run(["wl-copy","-t","text/uri-list"],input=uris,**policy)
 
-def copy_file_x11(files:list[Union[str,bytes]],encode="utf-8") -> None:
+def copy_file_x11(files:list[Union[str,bytes]],encode="utf-8",**policy) -> None:
     """
     Copies a file to the clipboard, on Linux (X11).
 
@@ -115,11 +326,11 @@ def copy_file_x11(files:list[Union[str,bytes]],encode="utf-8") -> None:
     uris = [f"file://{os.path.abspath(file)}" for file in files if len(file) != 0]
     if encode != "bytes": uris = [uri.encode(encode) for uri in uris]
     uris = b"\n".join(uris)
-    subprocess.run(["xclip","-selection","clipboard","-t","text/uri-list"],input=uris,check=True,close_fds=True)
+    _run(["xclip","-selection","clipboard","-t","text/uri-list"],input=uris,**policy)
     # '-t', 'text/uri-list'
     # raise NotImplementedError("pasteli.core.copy_file_x11(file,encode='utf-8')")
 
-def copy_file_windows(files:list[Union[str,bytes]],encode="utf-8"):
+def copy_file_windows(files:list[Union[str,bytes]],encode="utf-8",**policy):
     """
     Copies a file to the clipboard, on Windows.
 
@@ -129,7 +340,7 @@ def copy_file_windows(files:list[Union[str,bytes]],encode="utf-8"):
     """
     raise NotImplementedError("pasteli.core.copy_file_windows(file,encode='utf-8')")
 
-def copy_file_mac(files:list[Union[str,bytes]],encode="utf-8"):
+def copy_file_mac(files:list[Union[str,bytes]],encode="utf-8",**policy):
     """
     Copies a file to the pasteboard, on MacOS.
 
@@ -139,7 +350,7 @@ def copy_file_mac(files:list[Union[str,bytes]],encode="utf-8"):
     """
     raise NotImplementedError("pasteli.core.copy_file_mac(file,encode='utf-8')")
 
-def paste_text_wl(decode="utf-8") -> Union[str,bytes]:
+def paste_text_wl(decode="utf-8",**policy) -> Union[str,bytes]:
     """
     Pastes text from the clipboard, on Linux (Wayland).
 
@@ -147,21 +358,20 @@ def paste_text_wl(decode="utf-8") -> Union[str,bytes]:
         decode (str): The encoding that will be returned
     
     Raises:
-        TimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.ClipboardTimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.DeadlineExceededError: If the deadline runs out, including retries.
+        pasteli.errors.ClipboardExitError: If a commandline utility exits with a non-zero status.
     
     Returns:
         str|bytes: The content pasted from the clipboard, according to the encoding.
     """
-    try:
-        value = subprocess.run(["wl-paste"],capture_output=True,check=True,timeout=5).stdout
-        if value.endswith(b"\n"): value = value[:-1]
-        if decode != "bytes": value = value.decode(decode)
-        return value
-    except subprocess.TimeoutExpired:
-        raise TimeoutError("Wl-paste timed out, and the clipboard could not be pasted. (are you in a Wayland session?)")
+    value = _run(["wl-paste"],capture=True,**policy).stdout
+    if value.endswith(b"\n"): value = value[:-1]
+    if decode != "bytes": value = value.decode(decode)
+    return value
     # raise NotImplementedError("pasteli.core.paste_text_wl(decode='utf-8')")
 
-def paste_text_x11(decode="utf-8") -> Union[str,bytes]:
+def paste_text_x11(decode="utf-8",**policy) -> Union[str,bytes]:
     """
     Pastes text from the clipboard, on Linux (X11).
 
@@ -169,20 +379,19 @@ def paste_text_x11(decode="utf-8") -> Union[str,bytes]:
         decode (str): The encoding that will be returned
     
     Raises:
-        TimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.ClipboardTimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.DeadlineExceededError: If the deadline runs out, including retries.
+        pasteli.errors.ClipboardExitError: If a commandline utility exits with a non-zero status.
     
     Returns:
         str|bytes: The content pasted from the clipboard, according to the encoding.
     """
-    try:
-        # warnings.warn("pasteli.core.paste_text_x11(decode='utf-8') is not complete. Functionality may be missing.",errors.UnfinishedWarning)
-        value = subprocess.run(["xclip","-selection","clipboard","-o"],capture_output=True,check=True,timeout=5).stdout
-        if decode != "bytes": value = value.decode(decode)
-        return value
-    except subprocess.TimeoutExpired:
-        raise TimeoutError("Xclip timed out, and the clipboard could not be pasted. (are you in an X11 session?)")
+    # warnings.warn("pasteli.core.paste_text_x11(decode='utf-8') is not complete. Functionality may be missing.",errors.UnfinishedWarning)
+    value = _run(["xclip","-selection","clipboard","-o"],capture=True,**policy).stdout
+    if decode != "bytes": value = value.decode(decode)
+    return value
 
-def paste_text_windows(decode="utf-8") -> Union[str,bytes]:
+def paste_text_windows(decode="utf-8",**policy) -> Union[str,bytes]:
     """
     Pastes text from the clipboard, on Windows.
 
@@ -206,7 +415,7 @@ def paste_text_windows(decode="utf-8") -> Union[str,bytes]:
     return data
     # raise NotImplementedError("pasteli.core.paste_text_windows(decode='utf-8')")
 
-def paste_text_mac(decode="utf-8") -> Union[str,bytes]:
+def paste_text_mac(decode="utf-8",**policy) -> Union[str,bytes]:
     """
     Pastes text from the pasteboard, on MacOS.
 
@@ -214,53 +423,51 @@ def paste_text_mac(decode="utf-8") -> Union[str,bytes]:
         decode (str): The encoding that will be returned
     
     Raises:
-        TimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.ClipboardTimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.DeadlineExceededError: If the deadline runs out, including retries.
+        pasteli.errors.ClipboardExitError: If a commandline utility exits with a non-zero status.
     
     Returns:
         str|bytes: The content pasted from the clipboard, according to the encoding.
     """
-    try:
-        value = subprocess.run(["pbpaste"],capture_output=True,check=True,timeout=5).stdout
-        if value.endswith(b"\n"): value = value[:-1]
-        if decode != "bytes": value = value.decode(decode)
-        return value
-    except subprocess.TimeoutExpired:
-        raise TimeoutError("Pbpaste timed out, and the clipboard could not be pasted.")
+    value = _run(["pbpaste"],capture=True,**policy).stdout
+    if value.endswith(b"\n"): value = value[:-1]
+    if decode != "bytes": value = value.decode(decode)
+    return value
     # raise NotImplementedError("pasteli.core.paste_text_wl(decode='utf-8')")
 
-def paste_file_wl(decode="utf-8"):
+def paste_file_wl(decode="utf-8",**policy):
     """
     Pastes a file from the clipboard, on Linux (Wayland).
 
     Args:
         decode (str): The encoding that will be returned
     
+    Raises:
+        pasteli.errors.ClipboardTimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.DeadlineExceededError: If the deadline runs out, including retries.
+        pasteli.errors.ClipboardExitError: If a commandline utility exits with a non-zero status.
+    
     Returns:
-        str|bytes: A list of file paths from the clipboard, in the format of the encoding.
+        list[str|bytes]: A list of file paths from the clipboard, in the format of the encoding.
     """
-    try:
-        # warnings.warn("pasteli.core.paste_text_x11(decode='utf-8') is not complete. Functionality may be missing.",errors.UnfinishedWarning)
-        raw = subprocess.run(["wl-paste","-t","text/uri-list"],capture_output=True,check=True,timeout=5).stdout
-        uris = [x for x in raw.split(b"\r\n") if x != b"" and x != b"\n"]
-        value = []
-        for uri in uris:
-            parsed = uri.split(b"://")
-            scheme = parsed[0]
-            print(scheme)
-            if scheme != b"file":
-                warnings.warn(f"Not a file URL. ({uri} from {uris}) Is the clipboard data a file or a list of files?",EncodingWarning)
-                return []
-            path = b"://".join(parsed[1:])
-            value.append(unquote_to_bytes(path))
-        if decode != "bytes": value = [x.decode(decode) for x in value]
-        return value
-    except subprocess.TimeoutExpired:
-        raise TimeoutError("wl-paste timed out, and the clipboard could not be pasted. (are you in an Wayland session?)")
-    except subprocess.CalledProcessError as e:
-        if e.returncode == 1:
-            warnings.warn("wl-paste returned exist status 1. Is the clipboard data a file or a list of files?",errors.ClipboardUtilityWarning)
-
-def paste_file_x11(decode="utf-8"):
+    # warnings.warn("pasteli.core.paste_text_x11(decode='utf-8') is not complete. Functionality may be missing.",errors.UnfinishedWarning)
+    raw = _run(["wl-paste","-t","text/uri-list"],capture=True,**policy).stdout
+    uris = [x for x in raw.split(b"\r\n") if x != b"" and x != b"\n"]
+    value = []
+    for uri in uris:
+        parsed = uri.split(b"://")
+        scheme = parsed[0]
+        print(scheme)
+        if scheme != b"file":
+            warnings.warn(f"Not a file URL. ({uri} from {uris}) Is the clipboard data a file or a list of files?",EncodingWarning)
+            return []
+        path = b"://".join(parsed[1:])
+        value.append(unquote_to_bytes(path))
+    if decode != "bytes": value = [x.decode(decode) for x in value]
+    return value
+
+def paste_file_x11(decode="utf-8",**policy):
     """
     Pastes a file from the clipboard, on Linux (X11).
 
@@ -268,34 +475,174 @@ def paste_file_x11(decode="utf-8"):
         decode (str): The encoding that will be returned
     
     Raises:
-        TimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.ClipboardTimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.DeadlineExceededError: If the deadline runs out, including retries.
+        pasteli.errors.ClipboardExitError: If a commandline utility exits with a non-zero status.
     
     Returns:
         list[str|bytes]: A list of file paths from the clipboard, in the format of the encoding.
     """
-    try:
-        # warnings.warn("pasteli.core.paste_text_x11(decode='utf-8') is not complete. Functionality may be missing.",errors.UnfinishedWarning)
-        raw = subprocess.run(["xclip","-selection","clipboard","-o","-t","text/uri-list"],capture_output=True,check=True,timeout=5).stdout
-        uris = [x for x in raw.split(b"\r\n") if x != b""]
-        value = []
-        for uri in uris:
-            parsed = uri.split(b"://")
-            scheme = parsed[0]
-            if scheme != b"file":
-                warnings.warn(f"Not a file URL. ({uri} from {uris})",EncodingWarning)
-                return []
-            path = b"://".join(parsed[1:])
-            value.append(unquote_to_bytes(path))
-        if decode != "bytes": value = [x.decode(decode) for x in value]
-        return value
-    except subprocess.TimeoutExpired:
-        raise TimeoutError("Xclip timed out, and the clipboard could not be pasted. (are you in an X11 session?)")
-    except subprocess.CalledProcessError as e:
-        if e.returncode == 1:
-            warnings.warn("Xclip returned exist status 1. Is the clipboard data a file or a list of files?",errors.ClipboardUtilityWarning)
+    # warnings.warn("pasteli.core.paste_text_x11(decode='utf-8') is not complete. Functionality may be missing.",errors.UnfinishedWarning)
+    raw = _run(["xclip","-selection","clipboard","-o","-t","text/uri-list"],capture=True,**policy).stdout
+    uris = [x for x in raw.split(b"\r\n") if x != b""]
+    value = []
+    for uri in uris:
+        parsed = uri.split(b"://")
+        scheme = parsed[0]
+        if scheme != b"file":
+            warnings.warn(f"Not a file URL. ({uri} from {uris})",EncodingWarning)
+            return []
+        path = b"://".join(parsed[1:])
+        value.append(unquote_to_bytes(path))
+    if decode != "bytes": value = [x.decode(decode) for x in value]
+    return value
     # raise NotImplementedError("pasteli.core.paste_file_x11(decode='utf-8')")
 
-def copy_text(text,encoding="utf-8"):
+def copy_mime_wl(data,mime,encode="utf-8",**policy):
+    """
+    Copies data under a MIME target to the clipboard, on Linux (Wayland).
+
+    Args:
+        data (str|bytes): The data to copy
+        mime (str): The MIME target, such as `pasteli.constants.MIME_HTML`.
+        encode (str): The encoding that's being passed.
+    """
+    if encode != "bytes": data = data.encode(encode)
+    _run(["wl-copy","-t",mime],input=data,**policy)
+
+def copy_mime_x11(data,mime,encode="utf-8",**policy):
+    """
+    Copies data under a MIME target to the clipboard, on Linux (X11).
+
+    Args:
+        data (str|bytes): The data to copy
+        mime (str): The MIME target, such as `pasteli.constants.MIME_HTML`.
+        encode (str): The encoding that's being passed.
+    """
+    if encode != "bytes": data = data.encode(encode)
+    _run(["xclip","-selection","clipboard","-t",mime],input=data,**policy)
+
+def copy_mime_windows(data,mime,encode="utf-8",**policy):
+    """
+    Copies data under a MIME target to the clipboard, on Windows.
+
+    Args:
+        data (str|bytes): The data to copy
+        mime (str): The MIME target, such as `pasteli.constants.MIME_HTML`.
+        encode (str): The encoding that's being passed.
+    """
+    raise NotImplementedError("pasteli.core.copy_mime_windows(data,mime,encode='utf-8')")
+
+def copy_mime_mac(data,mime,encode="utf-8",**policy):
+    """
+    Copies data under a MIME target to the pasteboard, on MacOS.
+    Only RTF is supported; pbcopy detects it from the `{\\rtf` header.
+
+    Args:
+        data (str|bytes): The data to copy
+        mime (str): The MIME target, such as `pasteli.constants.MIME_RTF`.
+        encode (str): The encoding that's being passed.
+    """
+    if mime != const.MIME_RTF: raise NotImplementedError(f"pasteli.core.copy_mime_mac(data,{mime!r},encode='utf-8')")
+    if encode != "bytes": data = data.encode(encode)
+    _run(["pbcopy"],input=data,**policy)
+
+def paste_mime_wl(mime,decode="utf-8",**policy) -> Union[str,bytes]:
+    """
+    Pastes data under a MIME target from the clipboard, on Linux (Wayland).
+
+    Args:
+        mime (str): The MIME target, such as `pasteli.constants.MIME_HTML`.
+        decode (str): The encoding that will be returned
+
+    Raises:
+        pasteli.errors.ClipboardTimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.DeadlineExceededError: If the deadline runs out, including retries.
+        pasteli.errors.ClipboardExitError: If a commandline utility exits with a non-zero status, such as when the target isn't offered.
+
+    Returns:
+        str|bytes: The content pasted from the clipboard, according to the encoding.
+    """
+    value = _run(["wl-paste","-n","-t",mime],capture=True,**policy).stdout
+    if decode != "bytes": value = value.decode(decode)
+    return value
+
+def paste_mime_x11(mime,decode="utf-8",**policy) -> Union[str,bytes]:
+    """
+    Pastes data under a MIME target from the clipboard, on Linux (X11).
+
+    Args:
+        mime (str): The MIME target, such as `pasteli.constants.MIME_HTML`.
+        decode (str): The encoding that will be returned
+
+    Raises:
+        pasteli.errors.ClipboardTimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.DeadlineExceededError: If the deadline runs out, including retries.
+        pasteli.errors.ClipboardExitError: If a commandline utility exits with a non-zero status, such as when the target isn't offered.
+
+    Returns:
+        str|bytes: The content pasted from the clipboard, according to the encoding.
+    """
+    value = _run(["xclip","-selection","clipboard","-o","-t",mime],capture=True,**policy).stdout
+    if decode != "bytes": value = value.decode(decode)
+    return value
+
+def paste_mime_windows(mime,decode="utf-8",**policy) -> Union[str,bytes]:
+    """
+    Pastes data under a MIME target from the clipboard, on Windows.
+
+    Args:
+        mime (str): The MIME target, such as `pasteli.constants.MIME_HTML`.
+        decode (str): The encoding that will be returned
+    """
+    raise NotImplementedError("pasteli.core.paste_mime_windows(mime,decode='utf-8')")
+
+def paste_mime_mac(mime,decode="utf-8",**policy) -> Union[str,bytes]:
+    """
+    Pastes data under a MIME target from the pasteboard, on MacOS. Only RTF is supported.
+
+    Args:
+        mime (str): The MIME target, such as `pasteli.constants.MIME_RTF`.
+        decode (str): The encoding that will be returned
+
+    Raises:
+        pasteli.errors.ClipboardTimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.DeadlineExceededError: If the deadline runs out, including retries.
+        pasteli.errors.ClipboardExitError: If a commandline utility exits with a non-zero status.
+
+    Returns:
+        str|bytes: The content pasted from the pasteboard, according to the encoding.
+    """
+    if mime != const.MIME_RTF: raise NotImplementedError(f"pasteli.core.paste_mime_mac({mime!r},decode='utf-8')")
+    value = _run(["pbpaste","-Prefer","rtf"],capture=True,**policy).stdout
+    if decode != "bytes": value = value.decode(decode)
+    return value
+
+def stream_mime_wl(mime,**policy) -> Iterator[bytes]:
+    """
+    Streams data under a MIME target from the clipboard in chunks, on Linux (Wayland).
+
+    Args:
+        mime (str): The MIME target, such as `pasteli.constants.MIME_HTML`.
+
+    Returns:
+        Iterator[bytes]: The content pasted from the clipboard, in chunks.
+    """
+    return _stream(["wl-paste","-n","-t",mime],**policy)
+
+def stream_mime_x11(mime,**policy) -> Iterator[bytes]:
+    """
+    Streams data under a MIME target from the clipboard in chunks, on Linux (X11).
+
+    Args:
+        mime (str): The MIME target, such as `pasteli.constants.MIME_HTML`.
+
+    Returns:
+        Iterator[bytes]: The content pasted from the clipboard, in chunks.
+    """
+    return _stream(["xclip","-selection","clipboard","-o","-t",mime],**policy)
+
+def copy_text(text,encoding="utf-8",**policy):
     """
     Calls the individual copying function for the active display server.
 
@@ -307,6 +654,9 @@ def copy_text(text,encoding="utf-8"):
         OSError: Unsupported system
         OSError: Could not determine system
         WindowsError: Bytes were passed, or could not convert to UTF-16LE.
+        pasteli.errors.ClipboardTimeoutError: If a commandline utility takes too long to copy.
+        pasteli.errors.DeadlineExceededError: If the deadline runs out, including retries.
+        pasteli.errors.ClipboardExitError: If a commandline utility exits with a non-zero status.
     
     Returns:
         None
@@ -314,17 +664,17 @@ def copy_text(text,encoding="utf-8"):
     ds = get_display_server()
     match ds:
         case const.DS_WAYLAND:
-            return copy_text_wl(text,encode=encoding)
+            return copy_text_wl(text,encode=encoding,**policy)
         case const.DS_X11:
-            return copy_text_x11(text,encode=encoding)
+            return copy_text_x11(text,encode=encoding,**policy)
         case const.DS_WINDOWS:
-            return copy_text_windows(text,encode=encoding)
+            return copy_text_windows(text,encode=encoding,**policy)
         case const.DS_WINDOWSERVER:
-            return copy_text_mac(text,encode=encoding)
+            return copy_text_mac(text,encode=encoding,**policy)
         case _:
             raise KeyError("pasteli.utils.get_display_server() returned unexpected value.")
 
-def copy_file(files,encoding="utf-8"):
+def copy_file(files,encoding="utf-8",**policy):
     """
     Calls the individual copying function for the active display server.
 
@@ -336,6 +686,9 @@ def copy_file(files,encoding="utf-8"):
         OSError: Unsupported system
         OSError: Could not determine system
         WindowsError: Bytes were passed, or could not convert to UTF-16LE.
+        pasteli.errors.ClipboardTimeoutError: If a commandline utility takes too long to copy.
+        pasteli.errors.DeadlineExceededError: If the deadline runs out, including retries.
+        pasteli.errors.ClipboardExitError: If a commandline utility exits with a non-zero status.
     
     Returns:
         None
@@ -344,17 +697,17 @@ def copy_file(files,encoding="utf-8"):
     ds = get_display_server()
     match ds:
         case const.DS_WAYLAND:
-            return copy_file_wl(files,encode=encoding)
+            return copy_file_wl(files,encode=encoding,**policy)
         case const.DS_X11:
-            return copy_file_x11(files,encode=encoding)
+            return copy_file_x11(files,encode=encoding,**policy)
         case const.DS_WINDOWS:
-            return copy_file_windows(files,encode=encoding)
+            return copy_file_windows(files,encode=encoding,**policy)
         case const.DS_WINDOWSERVER:
-            return copy_file_mac(files,encode=encoding)
+            return copy_file_mac(files,encode=encoding,**policy)
         case _:
             raise KeyError("pasteli.utils.get_display_server() returned unexpected value.")
 
-def paste_text(encoding="utf-8") -> Union[str,bytes]:
+def paste_text(encoding="utf-8",**policy) -> Union[str,bytes]:
     """
     Calls the individual pasting function for the active display server.
 
@@ -362,7 +715,9 @@ def paste_text(encoding="utf-8") -> Union[str,bytes]:
         encoding (str): The encoding that will be returned
     
     Raises:
-        TimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.ClipboardTimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.DeadlineExceededError: If the deadline runs out, including retries.
+        pasteli.errors.ClipboardExitError: If a commandline utility exits with a non-zero status.
         KeyError: If pasteli.utils.get_display_server() returned an unexpected value.
         EncodingWarning: If the clipboard failed to paste due to being the wrong type of data. May also occur with no data.
         OSError: Unsupported system
@@ -374,17 +729,17 @@ def paste_text(encoding="utf-8") -> Union[str,bytes]:
     ds = get_display_server()
     match ds:
         case const.DS_WAYLAND:
-            return paste_text_wl(decode=encoding)
+            return paste_text_wl(decode=encoding,**policy)
         case const.DS_X11:
-            return paste_text_x11(decode=encoding)
+            return paste_text_x11(decode=encoding,**policy)
         case const.DS_WINDOWS:
-            return paste_text_windows(decode=encoding)
+            return paste_text_windows(decode=encoding,**policy)
         case const.DS_WINDOWSERVER:
-            return paste_text_mac(decode=encoding)
+            return paste_text_mac(decode=encoding,**policy)
         case _:
             raise KeyError("pasteli.utils.get_display_server() returned unexpected value.")
 
-def paste_file(encoding="utf-8") -> Union[str,bytes]:
+def paste_file(encoding="utf-8",**policy) -> Union[str,bytes]:
     """
     Calls the individual pasting function for the active display server.
 
@@ -392,7 +747,9 @@ def paste_file(encoding="utf-8") -> Union[str,bytes]:
         encoding (str): The encoding that will be returned
     
     Raises:
-        TimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.ClipboardTimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.DeadlineExceededError: If the deadline runs out, including retries.
+        pasteli.errors.ClipboardExitError: If a commandline utility exits with a non-zero status.
         KeyError: If pasteli.utils.get_display_server() returned an unexpected value.
         EncodingWarning: If the clipboard failed to paste due to being the wrong type of data. May also occur with no data.
         OSError: Unsupported system
@@ -404,17 +761,114 @@ def paste_file(encoding="utf-8") -> Union[str,bytes]:
     ds = get_display_server()
     match ds:
         case const.DS_WAYLAND:
-            return paste_file_wl(decode=encoding)
+            return paste_file_wl(decode=encoding,**policy)
+        case const.DS_X11:
+            return paste_file_x11(decode=encoding,**policy)
+        case const.DS_WINDOWS:
+            return paste_file_windows(decode=encoding,**policy)
+        case const.DS_WINDOWSERVER:
+            return paste_file_mac(decode=encoding,**policy)
+        case _:
+            raise KeyError("pasteli.utils.get_display_server() returned unexpected value.")
+
+def copy_mime(data,mime,encoding="utf-8",**policy):
+    """
+    Calls the individual copying function for the active display server.
+
+    Args:
+        data (str|bytes): The data to copy
+        mime (str): The MIME target, such as `pasteli.constants.MIME_HTML`.
+        encoding (str): The encoding of the value you're passing
+
+    Raises:
+        NotImplementedError: If the target isn't supported on this system.
+        OSError: Unsupported system
+        OSError: Could not determine system
+        pasteli.errors.ClipboardTimeoutError: If a commandline utility takes too long to copy.
+        pasteli.errors.DeadlineExceededError: If the deadline runs out, including retries.
+        pasteli.errors.ClipboardExitError: If a commandline utility exits with a non-zero status.
+
+    Returns:
+        None
+    """
+    ds = get_display_server()
+    match ds:
+        case const.DS_WAYLAND:
+            return copy_mime_wl(data,mime,encode=encoding,**policy)
+        case const.DS_X11:
+            return copy_mime_x11(data,mime,encode=encoding,**policy)
+        case const.DS_WINDOWS:
+            return copy_mime_windows(data,mime,encode=encoding,**policy)
+        case const.DS_WINDOWSERVER:
+            return copy_mime_mac(data,mime,encode=encoding,**policy)
+        case _:
+            raise KeyError("pasteli.utils.get_display_server() returned unexpected value.")
+
+def paste_mime(mime,encoding="utf-8",**policy) -> Union[str,bytes]:
+    """
+    Calls the individual pasting function for the active display server.
+
+    Args:
+        mime (str): The MIME target, such as `pasteli.constants.MIME_HTML`.
+        encoding (str): The encoding that will be returned
+
+    Raises:
+        NotImplementedError: If the target isn't supported on this system.
+        pasteli.errors.ClipboardTimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.DeadlineExceededError: If the deadline runs out, including retries.
+        pasteli.errors.ClipboardExitError: If a commandline utility exits with a non-zero status, such as when the target isn't offered.
+        KeyError: If pasteli.utils.get_display_server() returned an unexpected value.
+        OSError: Unsupported system
+        OSError: Could not determine system
+
+    Returns:
+        str|bytes: The content pasted from the clipboard, according to the encoding.
+    """
+    ds = get_display_server()
+    match ds:
+        case const.DS_WAYLAND:
+            return paste_mime_wl(mime,decode=encoding,**policy)
         case const.DS_X11:
-            return paste_file_x11(decode=encoding)
+            return paste_mime_x11(mime,decode=encoding,**policy)
         case const.DS_WINDOWS:
-            return paste_file_windows(decode=encoding)
+            return paste_mime_windows(mime,decode=encoding,**policy)
         case const.DS_WINDOWSERVER:
-            return paste_file_mac(decode=encoding)
+            return paste_mime_mac(mime,decode=encoding,**policy)
+        case _:
+            raise KeyError("pasteli.utils.get_display_server() returned unexpected value.")
+
+def stream_mime(mime,**policy) -> Iterator[bytes]:
+    """
+    Calls the individual streaming function for the active display server.
+    Chunks are yielded as the clipboard owner sends them, so large content is never buffered whole.
+
+    Args:
+        mime (str): The MIME target, such as `pasteli.constants.MIME_HTML`.
+
+    Raises:
+        NotImplementedError: If streaming isn't supported on this system.
+        pasteli.errors.ClipboardTimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.DeadlineExceededError: If the deadline runs out.
+        pasteli.errors.ClipboardExitError: If a commandline utility exits with a non-zero status, such as when the target isn't offered.
+        KeyError: If pasteli.utils.get_display_server() returned an unexpected value.
+        OSError: Unsupported system
+        OSError: Could not determine system
+
+    Returns:
+        Iterator[bytes]: The content pasted from the clipboard, in chunks.
+    """
+    ds = get_display_server()
+    match ds:
+        case const.DS_WAYLAND:
+            return stream_mime_wl(mime,**policy)
+        case const.DS_X11:
+            return stream_mime_x11(mime,**policy)
+        case const.DS_WINDOWS | const.DS_WINDOWSERVER:
+            raise NotImplementedError(f"pasteli.core.stream_mime({mime!r})")
         case _:
             raise KeyError("pasteli.utils.get_display_server() returned unexpected value.")
 
-def copy(mode:int,text:Optional[Union[str,bytes]]=None,file:Optional[Union[str,bytes]]=None,encoding:str="utf-8") -> None:
+def copy(mode:int,text:Optional[Union[str,bytes]]=None,file:Optional[Union[str,bytes]]=None,encoding:str="utf-8",timeout:Optional[float]=_DEFAULT,deadline:Optional[float]=_DEFAULT,retries:Optional[int]=_DEFAULT,backoff:Optional[float]=_DEFAULT,retry_on:Optional[Callable[[subprocess.CompletedProcess],bool]]=_DEFAULT) -> None:
     """
     Calls the individual copying function for the type (`mode`) of medium supplied.
     Pass one of (text, file)didnt 
@@ -423,7 +877,12 @@ def copy(mode:int,text:Optional[Union[str,bytes]]=None,file:Optional[Union[str,b
         mode (int): What type of medium? Use `pasteli.constants.CMODE_*` values.
         text (str|bytes|list[str|bytes]): The data to copy (works for all modes)
         file (list[str|bytes], optional): The file path to copy (works for CMODE_FILE)
-        encoding (str): The encoding of the value you're passing (works for CMODE_TEXT, CMODE_FILE)
+        encoding (str): The encoding of the value you're passing (works for all modes)
+        timeout (float, optional): Seconds allowed per attempt. Policy arguments default to the global setting (see `configure`); None disables them for this call.
+        deadline (float, optional): Seconds allowed for the whole copy, including retries.
+        retries (int, optional): Extra attempts after a timeout, or after a non-zero exit accepted by `retry_on`.
+        backoff (float, optional): Seconds slept before the first retry, doubled on each following retry.
+        retry_on (Callable[[subprocess.CompletedProcess],bool], optional): Decides whether a non-zero exit is transient and worth retrying. Timeouts are always retried.
     
     Raises:
         TypeError: If no data is passed
@@ -431,6 +890,9 @@ def copy(mode:int,text:Optional[Union[str,bytes]]=None,file:Optional[Union[str,b
         OSError: Unsupported system
         OSError: Could not determine system
         WindowsError: Bytes were passed, or could not convert to UTF-16LE.
+        pasteli.errors.ClipboardTimeoutError: If a commandline utility takes too long to copy.
+        pasteli.errors.DeadlineExceededError: If the deadline runs out, including retries.
+        pasteli.errors.ClipboardExitError: If a commandline utility exits with a non-zero status.
     
     Returns:
         None
@@ -438,26 +900,43 @@ def copy(mode:int,text:Optional[Union[str,bytes]]=None,file:Optional[Union[str,b
 
     if text == None and file == None:
         raise TypeError("Pass exactly one of (text, file)")
+    policy = dict(timeout=timeout,deadline=deadline,retries=retries,backoff=backoff,retry_on=retry_on)
 
     match mode:
         case const.CMODE_TEXT:
-            return copy_text(text,encoding=encoding)
+            return copy_text(text,encoding=encoding,**policy)
         case const.CMODE_FILE:
-            return copy_file(file or text,encoding=encoding)
+            return copy_file(file or text,encoding=encoding,**policy)
+        case const.CMODE_HTML:
+            return copy_mime(text,const.MIME_HTML,encoding=encoding,**policy)
+        case const.CMODE_RTF:
+            return copy_mime(text,const.MIME_RTF,encoding=encoding,**policy)
         case _:
             raise KeyError("copy(mode, ...)    mode should be a CMODE constant from pasteli.constants.")
 
-def paste(mode:int,encoding:str="utf-8") -> Union[str,bytes]:
+def paste(mode:int,encoding:str="utf-8",timeout:Optional[float]=_DEFAULT,deadline:Optional[float]=_DEFAULT,retries:Optional[int]=_DEFAULT,backoff:Optional[float]=_DEFAULT,hedge:Optional[float]=_DEFAULT,retry_on:Optional[Callable[[subprocess.CompletedProcess],bool]]=_DEFAULT,plain:bool=False) -> Union[str,bytes]:
     """
     Calls the individual pasting function for the type (`mode`) of medium supplied.
 
     Args:
         mode (int): What type of medium? Use pasteli.constants.CMODE_* values here.
         encoding (str): The encoding that will be returned
+        timeout (float, optional): Seconds allowed per attempt. Policy arguments default to the global setting (see `configure`); None disables them for this call.
+        deadline (float, optional): Seconds allowed for the whole paste, including retries.
+        retries (int, optional): Extra attempts after a timeout, or after a non-zero exit accepted by `retry_on`.
+        backoff (float, optional): Seconds slept before the first retry, doubled on each following retry.
+        hedge (float, optional): Seconds before a second read is started alongside a slow first one.
+        retry_on (Callable[[subprocess.CompletedProcess],bool], optional): Decides whether a non-zero exit is transient and worth retrying. Timeouts are always retried.
+        plain (bool): Convert HTML to plain text while it streams in, instead of pasting the HTML (works for CMODE_HTML).
+            Streamed pastes honour `timeout` and `deadline` only; `retries`, `backoff`, `retry_on` and `hedge`
+            are ignored, with a `pasteli.errors.ClipboardUtilityWarning` if retries or hedging are passed to this call.
     
     Raises:
-        TimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.ClipboardTimeoutError: If a commandline utility takes too long to paste.
+        pasteli.errors.DeadlineExceededError: If the deadline runs out, including retries.
+        pasteli.errors.ClipboardExitError: If a commandline utility exits with a non-zero status.
         KeyError: If no valid mode is passed.
+        NotImplementedError: If the mode isn't supported on this system.
         EncodingWarning: If the clipboard failed to paste due to being the wrong type of data. May also occur with no data.
         OSError: Unsupported system
         OSError: Could not determine system
@@ -465,10 +944,18 @@ def paste(mode:int,encoding:str="utf-8") -> Union[str,bytes]:
     Returns:
         str|bytes: The content pasted from the clipboard, according to the encoding.
     """
+    policy = dict(timeout=timeout,deadline=deadline,retries=retries,backoff=backoff,hedge=hedge,retry_on=retry_on)
     match mode:
         case const.CMODE_TEXT:
-            return paste_text(encoding=encoding)
+            return paste_text(encoding=encoding,**policy)
         case const.CMODE_FILE:
-            return paste_file(encoding=encoding)
+            return paste_file(encoding=encoding,**policy)
+        case const.CMODE_HTML if plain:
+            text = "".join(iter_html_text(stream_mime(const.MIME_HTML,**policy),encoding="utf-8" if encoding == "bytes" else encoding))
+            return text.encode("utf-8") if encoding == "bytes" else text
+        case const.CMODE_HTML:
+            return paste_mime(const.MIME_HTML,encoding=encoding,**policy)
+        case const.CMODE_RTF:
+            return paste_mime(const.MIME_RTF,encoding=encoding,**policy)
         case _:
             raise KeyError("paste(mode)    mode should be a CMODE constant from pasteli.constants.")
\ No newline at end of file
@@ -26,4 +26,35 @@ class ClipboardUtilityError(Exception):
 
 class ClipboardUtilityWarning(Warning):
     def __init__(self,text=None):
-        super().__init__(text)
\ No newline at end of file
+        super().__init__(text)
+
+class ClipboardTimeoutError(ClipboardUtilityError,TimeoutError):
+    """
+    A commandline utility did not finish within its per-attempt timeout.
+
+    Subclasses `TimeoutError`, so code that caught the old bare `TimeoutError` keeps working.
+    """
+    def __init__(self,text=None,utility=None,attempts=1):
+        super().__init__(text)
+        self.utility = utility
+        self.attempts = attempts
+
+class DeadlineExceededError(ClipboardTimeoutError):
+    """
+    The overall deadline of an operation ran out, including any retries.
+    """
+    def __init__(self,text=None,utility=None,attempts=1):
+        super().__init__(text,utility=utility,attempts=attempts)
+
+class ClipboardExitError(ClipboardUtilityError):
+    """
+    A commandline utility exited with a non-zero status.
+
+    Usually the clipboard owner is busy, or doesn't offer the requested target.
+    """
+    def __init__(self,text=None,utility=None,returncode=None,stderr=None,attempts=1):
+        super().__init__(text)
+        self.utility = utility
+        self.returncode = returncode
+        self.stderr = stderr
+        self.attempts = attempts
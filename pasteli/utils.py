@@ -16,9 +16,13 @@ You should have received a copy of the GNU Lesser General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import os,platform
+import os,platform,codecs
+from html.parser import HTMLParser
+from typing import Iterable, Iterator
 from . import constants as const
 
+__all__ = ["get_display_server","iter_html_text","html_to_text"]
+
 def get_display_server() -> int:
     """
     Returns the active display server as a `pasteli.constants.DS_*` value.
@@ -53,4 +57,126 @@ def get_display_server() -> int:
             case "Java":
                 raise OSError("Cannot determine Display Servers other than Linux (Wayland) and Linux (X11) when using Jython.")
             case _:
-                raise OSError("Could not determine your operating system.")
\ No newline at end of file
+                raise OSError("Could not determine your operating system.")
+
+class _HTMLTextParser(HTMLParser):
+    """
+    Turns HTML into plain text as it's fed, without building a document tree.
+    """
+    BLOCK = {"p","div","section","article","header","footer","nav","aside","main","ul","ol","li","dl","dt","dd",
+             "table","tr","h1","h2","h3","h4","h5","h6","blockquote","pre","hr","figure","figcaption","address"}
+    SKIP = {"script","style","title","template","noscript"} # Not "head": its end tag is optional, and nothing else in it has text.
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.out = []
+        self.skip = 0
+        self.pre = 0
+        self.pre_start = False # Browsers drop a newline straight after <pre>.
+        self.started = False
+        self.pending = 0    # Line breaks held back until more text follows, so output never ends on a break.
+        self.newline = True # Start of output counts as a fresh line, so leading breaks are dropped.
+        self.space = False
+
+    def _emit(self,text):
+        if self.started: self.out.append("\n"*self.pending)
+        self.pending = 0
+        self.started = True
+        self.out.append(text)
+
+    def _break(self):
+        if not self.newline:
+            self.pending += 1
+            self.newline = True
+        self.space = False
+
+    def handle_starttag(self,tag,attrs):
+        if tag in self.SKIP: self.skip += 1
+        elif tag == "br":
+            self.pending += 1
+            self.newline = True
+            self.space = False
+        elif tag in self.BLOCK: self._break()
+        elif tag in ("td","th") and not self.newline: self.space = True
+        if tag == "pre":
+            self.pre += 1
+            self.pre_start = True
+
+    def handle_endtag(self,tag):
+        if tag in self.SKIP: self.skip = max(0,self.skip-1)
+        elif tag in self.BLOCK: self._break()
+        if tag == "pre": self.pre = max(0,self.pre-1)
+
+    def handle_startendtag(self,tag,attrs):
+        if tag not in self.SKIP: self.handle_starttag(tag,attrs)
+
+    def handle_data(self,data):
+        if self.skip: return
+        if self.pre:
+            if self.pre_start and data.startswith("\n"): data = data[1:]
+            self.pre_start = False
+            lead = len(data)-len(data.lstrip("\n"))
+            if lead:
+                self.pending += lead
+                self.newline = True
+                data = data[lead:]
+            text = data.rstrip("\n")
+            if text:
+                self._emit(text)
+                self.newline = False
+            if len(text) != len(data):
+                self.pending += len(data)-len(text)
+                self.newline = True
+            self.space = False
+            return
+        words = data.split()
+        if not words:
+            if data and not self.newline: self.space = True
+            return
+        if (self.space or data[0].isspace()) and not self.newline: self._emit(" ")
+        self._emit(" ".join(words))
+        self.newline = False
+        self.space = data[-1].isspace()
+
+    def take(self) -> str:
+        text = "".join(self.out)
+        self.out.clear()
+        return text
+
+def iter_html_text(chunks:Iterable[bytes],encoding:str="utf-8") -> Iterator[str]:
+    """
+    Converts HTML to plain text incrementally, yielding text as each chunk is parsed.
+    Only the unparsed tail of the input is held in memory, never the whole document.
+    Leading and trailing line breaks are dropped, however the input is chunked.
+
+    Args:
+        chunks (Iterable[bytes]): The HTML, in chunks of any size.
+        encoding (str): The encoding of the HTML.
+
+    Returns:
+        Iterator[str]: Plain text, in pieces.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    parser = _HTMLTextParser()
+    for chunk in chunks:
+        parser.feed(decoder.decode(chunk))
+        text = parser.take()
+        if text: yield text
+    parser.feed(decoder.decode(b"",final=True))
+    parser.close()
+    text = parser.take()
+    if text: yield text
+
+def html_to_text(html:str|bytes,encoding:str="utf-8") -> str:
+    """
+    Converts a whole HTML document to plain text. See `iter_html_text` for the streaming version.
+
+    Args:
+        html (str|bytes): The HTML to convert.
+        encoding (str): The encoding of the HTML, if bytes were passed.
+
+    Returns:
+        str: The plain text.
+    """
+    if isinstance(html,str): html,encoding = html.encode("utf-8"),"utf-8"
+    return "".join(iter_html_text([html],encoding=encoding))
@@ -0,0 +1,197 @@
+import os,sys,time
+os.environ.setdefault("PASTELI_SKIP_DEP_CHECK","1")
+
+import pytest
+from pasteli import core, errors
+
+def python(code):
+    return [sys.executable,"-c",code]
+
+def test_run_returns_output():
+    result = core._run(python("print('hi')"),capture=True)
+    assert result.stdout.strip() == b"hi"
+
+def test_run_timeout_is_structured():
+    with pytest.raises(errors.ClipboardTimeoutError) as info:
+        core._run(python("import time; time.sleep(5)"),capture=True,timeout=0.2)
+    assert isinstance(info.value,TimeoutError)
+    assert info.value.attempts == 1
+
+def test_run_exit_status_is_structured():
+    with pytest.raises(errors.ClipboardExitError) as info:
+        core._run(python("import sys; sys.stderr.write('busy'); sys.exit(1)"),capture=True,retries=2,backoff=0)
+    assert info.value.returncode == 1
+    assert info.value.stderr == b"busy"
+    assert info.value.attempts == 1
+
+def test_run_retries_exit_status_accepted_by_retry_on():
+    with pytest.raises(errors.ClipboardExitError) as info:
+        core._run(python("import sys; sys.stderr.write('busy'); sys.exit(1)"),capture=True,retries=2,backoff=0,retry_on=lambda result: b"busy" in result.stderr)
+    assert info.value.attempts == 3
+
+def test_run_retries_transient_failure(tmp_path):
+    marker = tmp_path/"marker"
+    code = f"import os,time; p={str(marker)!r}\nif not os.path.exists(p): open(p,'w').close(); time.sleep(5)\nprint('ok')"
+    result = core._run(python(code),capture=True,timeout=0.5,retries=1,backoff=0)
+    assert result.stdout.strip() == b"ok"
+
+def test_run_deadline_caps_retries():
+    start = time.monotonic()
+    with pytest.raises(errors.DeadlineExceededError):
+        core._run(python("import time; time.sleep(5)"),capture=True,timeout=1,deadline=0.3,retries=10)
+    assert time.monotonic()-start < 2
+
+def test_run_hedge_wins_over_slow_first_read(tmp_path):
+    marker = tmp_path/"marker"
+    code = f"import os,time; p={str(marker)!r}\nif not os.path.exists(p): open(p,'w').close(); time.sleep(5)\nprint('fast')"
+    start = time.monotonic()
+    result = core._run(python(code),capture=True,timeout=3,hedge=0.3)
+    assert result.stdout.strip() == b"fast"
+    assert time.monotonic()-start < 2
+
+def test_run_hedge_ignores_fast_failure(tmp_path):
+    marker = tmp_path/"marker"
+    code = f"import os,sys,time; p={str(marker)!r}\nif os.path.exists(p): sys.exit(1)\nopen(p,'w').close(); time.sleep(0.6); print('slow')"
+    result = core._run(python(code),capture=True,timeout=3,hedge=0.2)
+    assert result.stdout.strip() == b"slow"
+
+def test_run_hedge_returns_failure_when_both_fail():
+    with pytest.raises(errors.ClipboardExitError):
+        core._run(python("import sys,time; time.sleep(0.3); sys.exit(1)"),capture=True,timeout=3,hedge=0.1)
+
+def test_configure_rejects_unknown_option():
+    with pytest.raises(TypeError):
+        core.configure(speed=1)
+
+def test_configure_validates_values(monkeypatch):
+    monkeypatch.setattr(core,"_policy",dict(core._policy))
+    with pytest.raises(TypeError):
+        core.configure(retries=None)
+    with pytest.raises(ValueError):
+        core.configure(retries=-1)
+    with pytest.raises(ValueError):
+        core.configure(backoff=-0.1)
+    with pytest.raises(TypeError):
+        core.configure(retry_on=1)
+    core.configure(retries=2,backoff=0,retry_on=None,hedge=None)
+
+def test_run_none_disables_global_policy(monkeypatch):
+    monkeypatch.setattr(core,"_policy",dict(core._policy))
+    seen = []
+    def attempt(args,input,capture,timeout,hedge):
+        seen.append((timeout,hedge))
+        return core.subprocess.CompletedProcess(args,0,b"",b"")
+    monkeypatch.setattr(core,"_attempt",attempt)
+    core.configure(timeout=1,hedge=0.05)
+    core._run(["x"],capture=True)
+    core._run(["x"],capture=True,timeout=None,hedge=None)
+    assert seen == [(1,0.05),(None,None)]
+
+def test_stream_yields_chunks():
+    chunks = list(core._stream(python("import sys; sys.stdout.write('x'*100)"),chunk_size=16))
+    assert b"".join(chunks) == b"x"*100
+    assert all(len(chunk) <= 16 for chunk in chunks)
+
+def test_stream_exit_status_is_structured():
+    with pytest.raises(errors.ClipboardExitError) as info:
+        list(core._stream(python("import sys; sys.exit(1)")))
+    assert info.value.returncode == 1
+
+def test_stream_timeout_is_structured():
+    with pytest.raises(errors.ClipboardTimeoutError):
+        list(core._stream(python("import time; time.sleep(5)"),timeout=0.2))
+
+def test_html_to_text_streams_across_chunk_boundaries():
+    html = "<html><head><style>p{}</style></head><body><h1>Report &amp; summary</h1><p>Hello   <b>world</b>,\n again</p><ul><li>one</li><li>two</li></ul>a<br>b<pre>  x\n  y</pre>café</body></html>".encode("utf-8")
+    expected = "Report & summary\nHello world, again\none\ntwo\na\nb\n  x\n  y\ncafé"
+    assert core.html_to_text(html) == expected
+    assert "".join(core.iter_html_text(html[i:i+1] for i in range(len(html)))) == expected
+
+def test_stream_drains_large_stderr():
+    chunks = core._stream(python("import sys; sys.stderr.write('e'*200000); sys.stdout.write('ok'); sys.exit(1)"),timeout=3)
+    start = time.monotonic()
+    with pytest.raises(errors.ClipboardExitError) as info:
+        list(chunks)
+    assert len(info.value.stderr) == 200000
+    assert time.monotonic()-start < 2
+
+def test_stream_warns_when_retries_are_ignored():
+    with pytest.warns(errors.ClipboardUtilityWarning):
+        list(core._stream(python("print('x')"),retries=2))
+
+def test_html_to_text_has_no_trailing_break():
+    assert core.html_to_text("<p>a</p>") == "a"
+    assert core.html_to_text("<table><tr><td>a</td><td>b</td></tr><tr><td>c</td><td>d</td></tr></table>") == "a b\nc d"
+    assert core.html_to_text("<br>a<br><br>b<br>") == "a\n\nb"
+
+@pytest.fixture
+def fake_run(monkeypatch):
+    calls = []
+    def run(args,input=None,capture=False,**policy):
+        calls.append((args,input))
+        return core.subprocess.CompletedProcess(args,0,b"<p>hi</p>",b"")
+    def stream(args,**policy):
+        calls.append((args,None))
+        yield b"<p>hello <b>wor"
+        yield b"ld</b></p>"
+    monkeypatch.setattr(core,"_run",run)
+    monkeypatch.setattr(core,"_stream",stream)
+    return calls
+
+@pytest.mark.parametrize("ds,copy_args,paste_args",[
+    (core.const.DS_WAYLAND,["wl-copy","-t","text/html"],["wl-paste","-n","-t","text/html"]),
+    (core.const.DS_X11,["xclip","-selection","clipboard","-t","text/html"],["xclip","-selection","clipboard","-o","-t","text/html"]),
+])
+def test_html_mode_dispatch(monkeypatch,fake_run,ds,copy_args,paste_args):
+    monkeypatch.setattr(core,"get_display_server",lambda: ds)
+    core.copy(core.const.CMODE_HTML,"<p>hi</p>")
+    assert fake_run[-1] == (copy_args,b"<p>hi</p>")
+    assert core.paste(core.const.CMODE_HTML) == "<p>hi</p>"
+    assert fake_run[-1][0] == paste_args
+    assert core.paste(core.const.CMODE_HTML,encoding="bytes") == b"<p>hi</p>"
+
+def test_rtf_mode_dispatch(monkeypatch,fake_run):
+    monkeypatch.setattr(core,"get_display_server",lambda: core.const.DS_X11)
+    core.copy(core.const.CMODE_RTF,b"{\\rtf1 hi}",encoding="bytes")
+    assert fake_run[-1] == (["xclip","-selection","clipboard","-t","text/rtf"],b"{\\rtf1 hi}")
+    core.paste(core.const.CMODE_RTF)
+    assert fake_run[-1][0] == ["xclip","-selection","clipboard","-o","-t","text/rtf"]
+
+def test_plain_html_paste(monkeypatch,fake_run):
+    monkeypatch.setattr(core,"get_display_server",lambda: core.const.DS_WAYLAND)
+    assert core.paste(core.const.CMODE_HTML,plain=True) == "hello world"
+    assert fake_run[-1][0] == ["wl-paste","-n","-t","text/html"]
+    assert core.paste(core.const.CMODE_HTML,plain=True,encoding="bytes") == b"hello world"
+
+def test_mac_supports_rtf_only(monkeypatch,fake_run):
+    monkeypatch.setattr(core,"get_display_server",lambda: core.const.DS_WINDOWSERVER)
+    core.copy(core.const.CMODE_RTF,"{\\rtf1 hi}")
+    assert fake_run[-1][0] == ["pbcopy"]
+    core.paste(core.const.CMODE_RTF)
+    assert fake_run[-1][0] == ["pbpaste","-Prefer","rtf"]
+    with pytest.raises(NotImplementedError):
+        core.copy(core.const.CMODE_HTML,"<p>hi</p>")
+    with pytest.raises(NotImplementedError):
+        core.paste(core.const.CMODE_HTML)
+
+def test_stream_does_not_warn_for_global_policy(monkeypatch,recwarn):
+    monkeypatch.setattr(core,"_policy",dict(core._policy))
+    core.configure(retries=2,hedge=0.05)
+    assert b"".join(core._stream(python("print('x')"))) == b"x\n"
+    assert not [w for w in recwarn if issubclass(w.category,errors.ClipboardUtilityWarning)]
+
+def test_stream_ignores_timer_firing_after_exit(monkeypatch):
+    class LateTimer:
+        # Fires on cancel, as if it went off just after the read finished.
+        def __init__(self,interval,function): self.function = function
+        def start(self): pass
+        def cancel(self): self.function()
+    monkeypatch.setattr(core.threading,"Timer",LateTimer)
+    assert b"".join(core._stream(python("print('x')"),timeout=5)) == b"x\n"
+
+def test_html_to_text_handles_unclosed_head():
+    assert core.html_to_text("<html><head><meta charset=utf-8><title>T</title><body><p>hi</p>") == "hi"
+
+def test_html_to_text_drops_newline_after_pre():
+    assert core.html_to_text("<pre>\ncode\n</pre>after") == "code\nafter"
+    assert core.html_to_text("<p>a</p><pre>\n\ncode</pre>") == "a\n\ncode"